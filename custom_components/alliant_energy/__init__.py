@@ -1,30 +1,157 @@
 """The Alliant Energy integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, STORAGE_VERSION, STORAGE_KEY
+from .client import AlliantEnergyClient
+from .const import (
+    ATTR_ENTRY_ID,
+    ATTR_FORCE,
+    ATTR_MAX_AGE,
+    ATTR_POLLS,
+    CONF_TARIFF,
+    DATA_TARIFF,
+    DOMAIN,
+    REFRESH_MAX_AGE,
+    SERVICE_PROFILE,
+    SERVICE_REFRESH,
+    STORAGE_VERSION,
+    STORAGE_KEY,
+)
+from .coordinator import AlliantEnergyCoordinator
+from .tariff import Tariff
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+TIME_OF_USE_SCHEMA = vol.Schema(
+    {
+        vol.Required("start"): cv.time,
+        vol.Required("end"): cv.time,
+        vol.Required("energy_rate"): vol.Coerce(float),
+        vol.Optional("weekdays"): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=0, max=6))]
+        ),
+        vol.Optional("months"): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=12))]
+        ),
+    }
+)
+
+SEASON_SCHEMA = vol.Schema(
+    {
+        vol.Required("months"): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1, max=12))]
+        ),
+        vol.Required("energy_rate"): vol.Coerce(float),
+    }
+)
+
+TIER_SCHEMA = vol.Schema(
+    {
+        vol.Optional("up_to"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Required("adder"): vol.Coerce(float),
+    }
+)
+
+def _valid_tariff(config: dict) -> dict:
+    """Validate a tariff by building it."""
+    try:
+        Tariff.from_dict(config)
+    except ValueError as err:
+        raise vol.Invalid(str(err)) from err
+    return config
+
+TARIFF_SCHEMA = vol.All(
+    {
+        vol.Required("energy_rate"): vol.Coerce(float),
+        vol.Optional("fixed_daily", default=0.0): vol.Coerce(float),
+        vol.Optional("seasons", default=[]): [SEASON_SCHEMA],
+        vol.Optional("time_of_use", default=[]): [TIME_OF_USE_SCHEMA],
+        vol.Optional("tiers", default=[]): [TIER_SCHEMA],
+    },
+    _valid_tariff,
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {DOMAIN: vol.Schema({vol.Optional(CONF_TARIFF): TARIFF_SCHEMA})},
+    extra=vol.ALLOW_EXTRA,
+)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        vol.Optional(ATTR_MAX_AGE, default=REFRESH_MAX_AGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_POLLS, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+    }
+)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services and load the optional tariff from configuration.yaml."""
+    if CONF_TARIFF in config.get(DOMAIN, {}):
+        hass.data[DATA_TARIFF] = Tariff.from_dict(config[DOMAIN][CONF_TARIFF])
+
+    _async_register_services(hass)
+
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Alliant Energy from a config entry."""
     store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
+    client = AlliantEnergyClient(
+        username=entry.data["username"],
+        password=entry.data["password"],
+        store=store,
+        tariff=hass.data.get(DATA_TARIFF),
+    )
+    coordinator = AlliantEnergyCoordinator(hass, client)
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "config": entry.data,
         "store": store,
-        "auth_data": await store.async_load() or {}
+        "auth_data": await store.async_load() or {},
+        "client": client,
+        "coordinator": coordinator,
     }
 
+    # Fetch initial data so we have data when entities subscribe
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await client.async_close()
+        raise
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -32,6 +159,76 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["client"].async_close()
 
     return unload_ok
+
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    def get_coordinators(call: ServiceCall) -> dict[str, AlliantEnergyCoordinator]:
+        """Return the coordinators targeted by a service call."""
+        entries = hass.data.get(DOMAIN, {})
+        entry_id = call.data.get(ATTR_ENTRY_ID)
+
+        if entry_id is None:
+            return {
+                target_id: entry_data["coordinator"]
+                for target_id, entry_data in entries.items()
+            }
+
+        if entry_id not in entries:
+            raise HomeAssistantError(f"Unknown Alliant Energy entry: {entry_id}")
+        return {entry_id: entries[entry_id]["coordinator"]}
+
+    async def async_handle_refresh(call: ServiceCall) -> ServiceResponse:
+        """Refresh one or all accounts, reusing recent data where possible."""
+        targets = get_coordinators(call)
+
+        await asyncio.gather(
+            *(
+                coordinator.async_refresh_if_stale(
+                    call.data[ATTR_MAX_AGE], force=call.data[ATTR_FORCE]
+                )
+                for coordinator in targets.values()
+            )
+        )
+
+        failed = [
+            target_id
+            for target_id, coordinator in targets.items()
+            if not coordinator.last_update_success
+        ]
+        if failed:
+            raise HomeAssistantError(
+                f"Failed to refresh Alliant Energy entries: {', '.join(failed)}"
+            )
+
+        if not call.return_response:
+            return None
+
+        return {
+            target_id: coordinator.data.as_dict() if coordinator.data else None
+            for target_id, coordinator in targets.items()
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        async_handle_refresh,
+        schema=REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_handle_profile(call: ServiceCall) -> None:
+        """Profile the next polls of one or all accounts."""
+        for coordinator in get_coordinators(call).values():
+            coordinator.profiler.start(call.data[ATTR_POLLS])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_handle_profile,
+        schema=PROFILE_SCHEMA,
+    )
@@ -1,5 +1,7 @@
 """Alliant Energy API Client."""
+import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from typing import Optional
 import json
@@ -8,9 +10,42 @@ import time
 
 _LOGGER = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class _Commodity:
+    """Usage endpoints and billing defaults for a metered commodity."""
+    name: str
+    historical_endpoint: str
+    historical_key: str
+    projected_endpoint: str
+    projected_key: str
+    uom: str
+    customer_charge: float
+
+ELECTRIC = _Commodity(
+    name="electric",
+    historical_endpoint="Electric",
+    historical_key="electricUsages",
+    projected_endpoint="ProjectedElectric",
+    projected_key="projectedElectric",
+    uom="kWh",
+    customer_charge=0.4932,  # Daily customer charge
+)
+
+# The gas endpoint and response names mirror the electric ones and have not
+# been verified against a live gas account
+GAS = _Commodity(
+    name="gas",
+    historical_endpoint="Gas",
+    historical_key="gasUsages",
+    projected_endpoint="ProjectedGas",
+    projected_key="projectedGas",
+    uom="CCF",
+    customer_charge=0.0,  # Folded into the derived per-CCF rate
+)
+
 class AlliantEnergyData:
     """Class to hold the energy data."""
-    def __init__(self):
+    def __init__(self, customer_charge: float = ELECTRIC.customer_charge):
         self.usage_to_date: float = None
         self.forecasted_usage: float = None
         self.typical_usage: float = None
@@ -22,8 +57,9 @@ class AlliantEnergyData:
         self.last_api_update: datetime = None
         self.last_meter_read: datetime = None
         self.cost_per_kwh: float = None
-        self.customer_charge: float = 0.4932  # Daily customer charge
+        self.customer_charge: float = customer_charge
         self.is_cost_estimated: bool = False
+        self.gas: Optional["AlliantEnergyData"] = None
 
     def calculate_cost(self, kwh: float, days: float) -> float:
         """Calculate cost including customer charge."""
@@ -31,6 +67,34 @@ class AlliantEnergyData:
             return None
         return (kwh * self.cost_per_kwh) + (days * self.customer_charge)
 
+    def as_dict(self) -> dict:
+        """Return a JSON-serializable snapshot of the data."""
+        result = {}
+        for key, value in vars(self).items():
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            elif isinstance(value, AlliantEnergyData):
+                value = value.as_dict()
+            result[key] = value
+        return result
+
+# Meter type values treated as gas, compared case-insensitively
+GAS_METER_TYPES = {"g", "gas", "natural gas"}
+
+def _meter_type(meter: dict) -> Optional[str]:
+    """Return the normalized type of a meter entry, if it has one.
+
+    The meterType/serviceType field names are assumed, not verified.
+    """
+    meter_type = meter.get("meterType") or meter.get("serviceType")
+    if meter_type is None:
+        return None
+    return str(meter_type).strip().lower()
+
+def _is_gas_meter(meter: dict) -> bool:
+    """Return True if a meter entry describes a gas meter."""
+    return _meter_type(meter) in GAS_METER_TYPES
+
 class AlliantEnergyAuthError(Exception):
     """Exception for authentication errors."""
     pass
@@ -40,19 +104,32 @@ class AlliantEnergyClient:
 
     BASE_URL = "https://alliant-svc.smartcmobile.com"
 
-    def __init__(self, username: str, password: str, store: Optional["Store"] = None):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        store: Optional["Store"] = None,
+        tariff: Optional["Tariff"] = None,
+    ):
         self._username = username
         self._password = password
         self._store = store
+        self._tariff = tariff
         self._token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expires_at: Optional[float] = None
         self._account_number: Optional[str] = None
         self._premise_number: Optional[str] = None
         self._meter_number: Optional[str] = None
+        self._gas_meter_number: Optional[str] = None
         self._session: Optional[aiohttp.ClientSession] = None
         self._uuid: Optional[str] = None
 
+    @property
+    def has_gas(self) -> bool:
+        """Return True if a gas meter was found for the premise."""
+        return self._gas_meter_number is not None
+
     def _get_base_headers(self) -> dict:
         """Get base headers used in all requests."""
         return {
@@ -87,6 +164,11 @@ class AlliantEnergyClient:
             _LOGGER.debug("Cached token expired")
             return False
 
+        if "gas_meter_number" not in auth_data:
+            # Cached before gas support, rediscover meters
+            _LOGGER.debug("Cached authentication data has no gas meter")
+            return False
+
         self._token = auth_data.get("token")
         self._refresh_token = auth_data.get("refresh_token")
         self._token_expires_at = auth_data.get("expires_at")
@@ -94,6 +176,7 @@ class AlliantEnergyClient:
         self._account_number = auth_data.get("account_number")
         self._premise_number = auth_data.get("premise_number")
         self._meter_number = auth_data.get("meter_number")
+        self._gas_meter_number = auth_data.get("gas_meter_number")
 
         _LOGGER.debug("Loaded cached authentication data")
         return bool(self._token and self._meter_number)
@@ -111,6 +194,7 @@ class AlliantEnergyClient:
             "account_number": self._account_number,
             "premise_number": self._premise_number,
             "meter_number": self._meter_number,
+            "gas_meter_number": self._gas_meter_number,
         }
 
         await self._store.async_save(auth_data)
@@ -196,7 +280,7 @@ class AlliantEnergyClient:
             await self._get_meter_details()
 
     async def _get_meter_details(self):
-        """Get meter number."""
+        """Get electric and gas meter numbers."""
         url = f"{self.BASE_URL}/Services/api/1/Usages/GetMeterAndPremise"
 
         headers = {
@@ -218,10 +302,206 @@ class AlliantEnergyClient:
             if not data["data"]:
                 raise AlliantEnergyAuthError("No meter found")
 
-            self._meter_number = data["data"][0]["meterNumber"]
+            meters = data["data"]
+            _LOGGER.debug("Meter details: %s", meters)
+            if any(_meter_type(meter) is None for meter in meters):
+                _LOGGER.info("Meter details have no meter type, gas meters can't be detected")
+
+            gas_meters = [meter for meter in meters if _is_gas_meter(meter)]
+            electric_meters = [meter for meter in meters if not _is_gas_meter(meter)]
+            if not electric_meters:
+                raise AlliantEnergyAuthError("No electric meter found")
+
+            self._meter_number = electric_meters[0]["meterNumber"]
+            self._gas_meter_number = gas_meters[0]["meterNumber"] if gas_meters else None
+
+    async def _async_get_json(self, url: str, params: dict, headers: dict) -> tuple[int, Optional[dict]]:
+        """Perform a GET request and return the status and decoded body."""
+        async with self._session.get(url, params=params, headers=headers) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, await response.json()
+
+    def _parse_historical(self, data: AlliantEnergyData, commodity: _Commodity, historical: list) -> None:
+        """Derive the rate and current billing period from historical usage."""
+        if not historical:
+            return
+
+        # Sort by reading date for reliability
+        sorted_readings = sorted(
+            historical,
+            key=lambda x: datetime.fromisoformat(x["readingFrom"].replace("Z", "+00:00"))
+        )
+
+        # Calculate cost per unit from most recent complete period
+        latest_reading = sorted_readings[-1]
+        period_start = datetime.fromisoformat(latest_reading["readingFrom"].replace("Z", "+00:00"))
+        period_end = datetime.fromisoformat(latest_reading["readingTo"].replace("Z", "+00:00"))
+        days_in_period = (period_end - period_start).days
+        total_cost = float(latest_reading["amount"])
+        total_usage = float(latest_reading["consumption"])
+
+        # Subtract out customer charge
+        customer_charge_total = days_in_period * data.customer_charge
+        energy_cost = total_cost - customer_charge_total
+
+        if total_usage > 0:
+            data.cost_per_kwh = energy_cost / total_usage
+            _LOGGER.debug(
+                "Calculated %s cost per %s from last period: $%.4f "
+                "(total cost: $%.2f - customer charge: $%.2f for %d days = $%.2f energy cost / %.1f %s)",
+                commodity.name,
+                commodity.uom,
+                data.cost_per_kwh,
+                total_cost,
+                data.customer_charge,
+                days_in_period,
+                energy_cost,
+                total_usage,
+                commodity.uom
+            )
+
+        # Calculate average period length for billing period projection
+        period_lengths = []
+        for reading in sorted_readings:
+            start = datetime.fromisoformat(reading["readingFrom"].replace("Z", "+00:00"))
+            end = datetime.fromisoformat(reading["readingTo"].replace("Z", "+00:00"))
+            period_lengths.append((end - start).days)
+
+        avg_period_length = round(sum(period_lengths) / len(period_lengths))
+
+        # Calculate current billing period from last completed billing period
+        data.start_date = period_end.replace(tzinfo=None)
+        data.end_date = data.start_date + timedelta(days=avg_period_length)
+
+        # Set last meter read
+        data.last_meter_read = period_end
+
+    def _parse_projected(self, data: AlliantEnergyData, commodity: _Commodity, projected: dict) -> None:
+        """Fill usage and cost figures from the projection, estimating missing costs."""
+        try:
+            data.usage_to_date = float(projected["soFarThisMonthProjectedConsumption"])
+        except (ValueError, TypeError):
+            data.usage_to_date = None
+
+        try:
+            data.forecasted_usage = float(projected["projectedConsumption"])
+        except (ValueError, TypeError):
+            data.forecasted_usage = None
+
+        try:
+            data.typical_usage = float(projected["averageThisYearConsumption"])
+        except (ValueError, TypeError):
+            data.typical_usage = None
+
+        try:
+            api_cost = float(projected["soFarThisMonthProjectedAmount"])
+            if api_cost > 0:
+                data.cost_to_date = api_cost
+            elif data.usage_to_date:
+                self._estimate_cost_to_date(data, commodity)
+        except (ValueError, TypeError):
+            if data.usage_to_date:
+                self._estimate_cost_to_date(data, commodity)
+
+        try:
+            api_cost = float(projected["projectedAmount"])
+            if api_cost > 0:
+                data.forecasted_cost = api_cost
+            elif data.forecasted_usage:
+                self._estimate_forecasted_cost(data, commodity)
+        except (ValueError, TypeError):
+            if data.forecasted_usage:
+                self._estimate_forecasted_cost(data, commodity)
+
+        try:
+            data.typical_cost = float(projected["averageThisYearAmount"])
+        except (ValueError, TypeError):
+            data.typical_cost = None
+
+    def _parse_commodity(
+        self, commodity: _Commodity, historical_response: tuple, projected_response: tuple
+    ) -> AlliantEnergyData:
+        """Build the data for a commodity from its historical and projected responses."""
+        historical_status, historical = historical_response
+        projected_status, projected = projected_response
+
+        data = AlliantEnergyData(customer_charge=commodity.customer_charge)
+        data.last_api_update = datetime.now()
+
+        # Historical data is parsed first, projections depend on it
+        if historical_status == 200:
+            self._parse_historical(data, commodity, historical["Result"][commodity.historical_key])
+
+        if projected_status == 200:
+            self._parse_projected(data, commodity, projected["Result"][commodity.projected_key])
+        elif projected_status == 401:
+            _LOGGER.error("Authentication failed for %s projected data. Token may have expired.", commodity.name)
+        else:
+            _LOGGER.error("Failed to get %s projected data: %s", commodity.name, projected_status)
+
+        return data
+
+    def _parse_optional_commodity(
+        self, commodity: _Commodity, historical_response, projected_response
+    ) -> Optional[AlliantEnergyData]:
+        """Build the data for an optional commodity, returning None on failure."""
+        try:
+            for response in (historical_response, projected_response):
+                if isinstance(response, BaseException):
+                    raise response
+            if historical_response[0] == 401:
+                _LOGGER.warning("Not authorized to read %s historical data", commodity.name)
+                return None
+            return self._parse_commodity(commodity, historical_response, projected_response)
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Failed to get %s data: %s", commodity.name, err)
+            return None
+
+    def _estimate_cost_to_date(self, data: AlliantEnergyData, commodity: _Commodity) -> None:
+        """Estimate the cost to date when the API doesn't provide it."""
+        if data.start_date is None:
+            return
+
+        now = datetime.now()
+        cost = None
+        if self._tariff is not None and commodity is ELECTRIC:
+            cost = self._tariff.estimate_cost(data.start_date, data.end_date, data.usage_to_date, until=now)
+        if cost is None:
+            days_so_far = (now - data.start_date).days
+            cost = data.calculate_cost(data.usage_to_date, days_so_far)
+
+        if cost is not None:
+            data.cost_to_date = cost
+            data.is_cost_estimated = True
+
+    def _estimate_forecasted_cost(self, data: AlliantEnergyData, commodity: _Commodity) -> None:
+        """Estimate the forecasted cost when the API doesn't provide it."""
+        if data.start_date is None or data.end_date is None:
+            return
+
+        cost = None
+        if self._tariff is not None and commodity is ELECTRIC:
+            cost = self._tariff.estimate_cost(data.start_date, data.end_date, data.forecasted_usage)
+        if cost is None:
+            period_days = (data.end_date - data.start_date).days
+            cost = data.calculate_cost(data.forecasted_usage, period_days)
+
+        if cost is not None:
+            data.forecasted_cost = cost
+            data.is_cost_estimated = True
 
     async def async_get_data(self) -> AlliantEnergyData:
-        """Get the energy data."""
+        """Get the energy data.
+
+        Electric data is returned directly, with gas data attached as
+        ``gas`` when the premise has a gas meter. All usage endpoints are
+        requested concurrently over the same authenticated session.
+        """
+        return await self._async_get_data(retry_auth=True)
+
+    async def _async_get_data(self, retry_auth: bool) -> AlliantEnergyData:
+        """Get the energy data, re-authenticating at most once."""
         if not self._session:
             self._session = aiohttp.ClientSession()
 
@@ -231,153 +511,56 @@ class AlliantEnergyClient:
         first_of_month = today.replace(day=1)
         last_of_month = date(today.year, today.month + 1, 1) if today.month < 12 else date(today.year + 1, 1, 1)
 
-        data = AlliantEnergyData()
-        data.last_api_update = datetime.now()
-
-        # Get historical data first
-        historical_url = f"{self.BASE_URL}/UsageAPI/api/V1/Electric"
-        historical_params = {
-            "AccountNumber": f"{self._premise_number}-{self._account_number}",
-            "MeterNumber": self._meter_number,
-            "From": today.replace(year=today.year - 1).strftime("%Y-%m-%d"),
-            "To": last_of_month.strftime("%Y-%m-%d"),
-            "Uom": "kWh",
-            "Periodicity": "MO"
-        }
-
         headers = {
             **self._get_base_headers(),
             "Authorization": f"Bearer {self._token}"
         }
 
-        async with self._session.get(historical_url, params=historical_params, headers=headers) as response:
-            if response.status == 200:
-                historical = (await response.json())["Result"]["electricUsages"]
-                if historical:
-                    # Sort by reading date for reliability
-                    sorted_readings = sorted(
-                        historical,
-                        key=lambda x: datetime.fromisoformat(x["readingFrom"].replace("Z", "+00:00"))
-                    )
-
-                    # Calculate cost per kWh from most recent complete period
-                    if sorted_readings:
-                        latest_reading = sorted_readings[-1]
-                        period_start = datetime.fromisoformat(latest_reading["readingFrom"].replace("Z", "+00:00"))
-                        period_end = datetime.fromisoformat(latest_reading["readingTo"].replace("Z", "+00:00"))
-                        days_in_period = (period_end - period_start).days
-                        total_cost = float(latest_reading["amount"])
-                        total_usage = float(latest_reading["consumption"])
-
-                        # Subtract out customer charge
-                        customer_charge_total = days_in_period * data.customer_charge
-                        energy_cost = total_cost - customer_charge_total
-
-                        if total_usage > 0:
-                            data.cost_per_kwh = energy_cost / total_usage
-                            _LOGGER.debug(
-                                "Calculated cost per kWh from last period: $%.4f "
-                                "(total cost: $%.2f - customer charge: $%.2f for %d days = $%.2f energy cost / %.1f kWh)",
-                                data.cost_per_kwh,
-                                total_cost,
-                                data.customer_charge,
-                                days_in_period,
-                                energy_cost,
-                                total_usage
-                            )
-
-                    # Calculate average period length for billing period projection
-                    period_lengths = []
-                    for reading in sorted_readings:
-                        start = datetime.fromisoformat(reading["readingFrom"].replace("Z", "+00:00"))
-                        end = datetime.fromisoformat(reading["readingTo"].replace("Z", "+00:00"))
-                        period_lengths.append((end - start).days)
-
-                    avg_period_length = round(sum(period_lengths) / len(period_lengths))
-
-                    # Get last completed billing period
-                    last_period = sorted_readings[-1]
-                    last_period_end = datetime.fromisoformat(last_period["readingTo"].replace("Z", "+00:00"))
-
-                    # Calculate current billing period
-                    data.start_date = last_period_end.replace(tzinfo=None)
-                    data.end_date = data.start_date + timedelta(days=avg_period_length)
-
-                    # Set last meter read
-                    data.last_meter_read = datetime.fromisoformat(
-                        last_period["readingTo"].replace("Z", "+00:00")
-                    )
-
-            elif response.status == 401:
-                _LOGGER.error("Authentication failed for historical data. Token may have expired.")
-                await self._get_token()
-                return await self.async_get_data()
-
-        # Get projected data
-        projected_url = f"{self.BASE_URL}/UsageAPI/api/V1/ProjectedElectric"
-        projected_params = {
-            "AccountNumber": f"{self._premise_number}-{self._account_number}",
-            "MeterNumber": self._meter_number,
-            "StartDate": first_of_month.strftime("%Y-%m-%d"),
-            "EndDate": last_of_month.strftime("%Y-%m-%d"),
-            "Type": "0"
-        }
-
-        async with self._session.get(projected_url, params=projected_params, headers=headers) as response:
-            if response.status == 200:
-                projected = (await response.json())["Result"]["projectedElectric"]
-                try:
-                    data.usage_to_date = float(projected["soFarThisMonthProjectedConsumption"])
-                except (ValueError, TypeError):
-                    data.usage_to_date = None
-
-                try:
-                    data.forecasted_usage = float(projected["projectedConsumption"])
-                except (ValueError, TypeError):
-                    data.forecasted_usage = None
-
-                try:
-                    data.typical_usage = float(projected["averageThisYearConsumption"])
-                except (ValueError, TypeError):
-                    data.typical_usage = None
-
-                try:
-                    api_cost = float(projected["soFarThisMonthProjectedAmount"])
-                    if api_cost > 0:
-                        data.cost_to_date = api_cost
-                    elif data.cost_per_kwh and data.usage_to_date:
-                        days_so_far = (datetime.now().replace(tzinfo=None) - data.start_date).days
-                        data.cost_to_date = data.calculate_cost(data.usage_to_date, days_so_far)
-                        data.is_cost_estimated = True
-                except (ValueError, TypeError):
-                    if data.cost_per_kwh and data.usage_to_date:
-                        days_so_far = (datetime.now().replace(tzinfo=None) - data.start_date).days
-                        data.cost_to_date = data.calculate_cost(data.usage_to_date, days_so_far)
-                        data.is_cost_estimated = True
-
-                try:
-                    api_cost = float(projected["projectedAmount"])
-                    if api_cost > 0:
-                        data.forecasted_cost = api_cost
-                    elif data.cost_per_kwh and data.forecasted_usage:
-                        period_days = (data.end_date - data.start_date).days
-                        data.forecasted_cost = data.calculate_cost(data.forecasted_usage, period_days)
-                        data.is_cost_estimated = True
-                except (ValueError, TypeError):
-                    if data.cost_per_kwh and data.forecasted_usage:
-                        period_days = (data.end_date - data.start_date).days
-                        data.forecasted_cost = data.calculate_cost(data.forecasted_usage, period_days)
-                        data.is_cost_estimated = True
-
-                try:
-                    data.typical_cost = float(projected["averageThisYearAmount"])
-                except (ValueError, TypeError):
-                    data.typical_cost = None
-
-            elif response.status == 401:
-                _LOGGER.error("Authentication failed for projected data. Token may have expired.")
-            else:
-                _LOGGER.error("Failed to get projected data: %s", response.status)
+        meters = [(ELECTRIC, self._meter_number)]
+        if self._gas_meter_number:
+            meters.append((GAS, self._gas_meter_number))
+
+        requests = []
+        for commodity, meter_number in meters:
+            historical_params = {
+                "AccountNumber": f"{self._premise_number}-{self._account_number}",
+                "MeterNumber": meter_number,
+                "From": today.replace(year=today.year - 1).strftime("%Y-%m-%d"),
+                "To": last_of_month.strftime("%Y-%m-%d"),
+                "Uom": commodity.uom,
+                "Periodicity": "MO"
+            }
+            projected_params = {
+                "AccountNumber": f"{self._premise_number}-{self._account_number}",
+                "MeterNumber": meter_number,
+                "StartDate": first_of_month.strftime("%Y-%m-%d"),
+                "EndDate": last_of_month.strftime("%Y-%m-%d"),
+                "Type": "0"
+            }
+            requests.append(self._async_get_json(
+                f"{self.BASE_URL}/UsageAPI/api/V1/{commodity.historical_endpoint}", historical_params, headers
+            ))
+            requests.append(self._async_get_json(
+                f"{self.BASE_URL}/UsageAPI/api/V1/{commodity.projected_endpoint}", projected_params, headers
+            ))
+
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+
+        electric_response = responses[0:2]
+        for response in electric_response:
+            if isinstance(response, BaseException):
+                raise response
+
+        if electric_response[0][0] == 401:
+            _LOGGER.error("Authentication failed for historical data. Token may have expired.")
+            if not retry_auth:
+                raise AlliantEnergyAuthError("Authentication failed for historical data")
+            await self._get_token()
+            return await self._async_get_data(retry_auth=False)
+
+        data = self._parse_commodity(ELECTRIC, *electric_response)
+        if len(meters) > 1:
+            data.gas = self._parse_optional_commodity(GAS, *responses[2:4])
 
         return data
 
@@ -9,6 +9,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     UnitOfEnergy,
+    UnitOfVolume,
     EntityCategory,
 )
 
@@ -16,6 +17,8 @@ DOMAIN = "alliant_energy"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 
+CONF_TARIFF = "tariff"
+
 # Storage constants
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}_auth_store"
@@ -23,10 +26,42 @@ STORAGE_KEY = f"{DOMAIN}_auth_store"
 # Update interval (in seconds) - 1 hour
 UPDATE_INTERVAL = 3600
 
+# Key in hass.data for the tariff loaded from configuration.yaml
+DATA_TARIFF = f"{DOMAIN}_tariff"
+
+# On-demand refresh service
+SERVICE_REFRESH = "refresh"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_FORCE = "force"
+ATTR_MAX_AGE = "max_age"
+
+# Calls within this window (in seconds) are coalesced into a single fetch
+REFRESH_COOLDOWN = 10
+
+# Cached data younger than this (in seconds) is returned without fetching
+REFRESH_MAX_AGE = 300
+
+# Profiling service
+SERVICE_PROFILE = "profile"
+ATTR_POLLS = "polls"
+
+# Number of hot functions and allocation sites kept per profiled poll
+PROFILE_TOP_N = 20
+
+# Number of profiled polls kept for diagnostics
+PROFILE_MAX_RESULTS = 10
+
+# Event loop sampling interval (in seconds) while profiling
+PROFILE_LOOP_INTERVAL = 0.05
+
+# Traceback depth recorded by tracemalloc while profiling
+PROFILE_TRACEMALLOC_FRAMES = 25
+
 @dataclass
 class AlliantEntityDescription(SensorEntityDescription):
     """Class describing Alliant Energy sensor entities."""
     value_fn: Callable[[Any], Any] = None
+    commodity: str = "electric"
 
 ELEC_SENSORS = (
     AlliantEntityDescription(
@@ -110,3 +145,95 @@ ELEC_SENSORS = (
         value_fn=lambda data: data.end_date,
     ),
 )
+
+GAS_SENSORS = (
+    AlliantEntityDescription(
+        key="gas_usage_to_date",
+        name="Current Bill Gas Usage To Date",
+        device_class=SensorDeviceClass.GAS,
+        native_unit_of_measurement=UnitOfVolume.CENTUM_CUBIC_FEET,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=1,
+        commodity="gas",
+        value_fn=lambda data: data.usage_to_date,
+    ),
+    AlliantEntityDescription(
+        key="gas_forecasted_usage",
+        name="Current Bill Gas Forecasted Usage",
+        device_class=SensorDeviceClass.GAS,
+        native_unit_of_measurement=UnitOfVolume.CENTUM_CUBIC_FEET,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=1,
+        commodity="gas",
+        value_fn=lambda data: data.forecasted_usage,
+    ),
+    AlliantEntityDescription(
+        key="gas_typical_usage",
+        name="Typical Monthly Gas Usage",
+        device_class=SensorDeviceClass.GAS,
+        native_unit_of_measurement=UnitOfVolume.CENTUM_CUBIC_FEET,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=1,
+        commodity="gas",
+        value_fn=lambda data: data.typical_usage,
+    ),
+    AlliantEntityDescription(
+        key="gas_cost_to_date",
+        name="Current Bill Gas Cost To Date",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="USD",
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        commodity="gas",
+        value_fn=lambda data: data.cost_to_date,
+    ),
+    AlliantEntityDescription(
+        key="gas_forecasted_cost",
+        name="Current Bill Gas Forecasted Cost",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="USD",
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        commodity="gas",
+        value_fn=lambda data: data.forecasted_cost,
+    ),
+    AlliantEntityDescription(
+        key="gas_typical_cost",
+        name="Typical Monthly Gas Cost",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="USD",
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        commodity="gas",
+        value_fn=lambda data: data.typical_cost,
+    ),
+    AlliantEntityDescription(
+        key="gas_cost_per_ccf",
+        name="Gas Cost per CCF",
+        device_class=SensorDeviceClass.MONETARY,
+        native_unit_of_measurement="USD/CCF",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=4,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        commodity="gas",
+        value_fn=lambda data: data.cost_per_kwh,
+    ),
+    AlliantEntityDescription(
+        key="gas_start_date",
+        name="Current Bill Gas Start Date",
+        device_class=SensorDeviceClass.DATE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        commodity="gas",
+        value_fn=lambda data: data.start_date,
+    ),
+    AlliantEntityDescription(
+        key="gas_end_date",
+        name="Current Bill Gas End Date",
+        device_class=SensorDeviceClass.DATE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        commodity="gas",
+        value_fn=lambda data: data.end_date,
+    ),
+)
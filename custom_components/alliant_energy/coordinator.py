@@ -0,0 +1,86 @@
+"""Data update coordinator for the Alliant Energy integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .client import AlliantEnergyClient, AlliantEnergyData
+from .const import DOMAIN, REFRESH_COOLDOWN, UPDATE_INTERVAL
+from .profiler import PollProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+class AlliantEnergyCoordinator(DataUpdateCoordinator[AlliantEnergyData]):
+    """Coordinate polling of a single Alliant Energy account."""
+
+    def __init__(self, hass: HomeAssistant, client: AlliantEnergyClient) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REFRESH_COOLDOWN, immediate=True
+            ),
+        )
+        self.client = client
+        self.profiler = PollProfiler(hass)
+        self._fetch_task: Optional[asyncio.Task] = None
+        self._last_fetch: Optional[float] = None
+
+    async def _async_update_data(self) -> AlliantEnergyData:
+        """Fetch data from API endpoint, joining any fetch already in flight."""
+        if self._fetch_task is None:
+            self._fetch_task = self.hass.async_create_task(self._async_fetch())
+            self._fetch_task.add_done_callback(self._clear_fetch_task)
+        # Shield so a cancelled caller doesn't abort the fetch other callers share
+        return await asyncio.shield(self._fetch_task)
+
+    async def _async_fetch(self) -> AlliantEnergyData:
+        """Run a single poll against the Alliant Energy API."""
+        if self.profiler.active:
+            data = await self.profiler.async_run(self.client.async_get_data)
+        else:
+            data = await self.client.async_get_data()
+        self._last_fetch = time.monotonic()
+        return data
+
+    def _clear_fetch_task(self, task: asyncio.Task) -> None:
+        """Forget the finished fetch so the next update starts a new one."""
+        if self._fetch_task is task:
+            self._fetch_task = None
+        # Mark the result as retrieved in case every awaiting caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Return True if the last successful fetch is younger than max_age seconds."""
+        if self._last_fetch is None or self.data is None:
+            return False
+        return time.monotonic() - self._last_fetch < max_age
+
+    async def async_refresh_if_stale(self, max_age: float, force: bool = False) -> None:
+        """Refresh data on demand unless the cached snapshot is recent enough.
+
+        Calls that arrive while a fetch is in flight join it, so they see its
+        result or failure. Forced calls skip the age check and the debouncer.
+        Other calls go through the debouncer, which drops calls made in its
+        cooldown after a fetch.
+        """
+        if force or self._fetch_task is not None:
+            await self.async_refresh()
+            return
+
+        if self.is_fresh(max_age):
+            _LOGGER.debug("Skipping refresh, cached data is younger than %ss", max_age)
+            return
+
+        await self.async_request_refresh()
@@ -0,0 +1,241 @@
+"""Opt-in profiling of the Alliant Energy poll path."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import cProfile
+from datetime import datetime
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    PROFILE_LOOP_INTERVAL,
+    PROFILE_MAX_RESULTS,
+    PROFILE_TOP_N,
+    PROFILE_TRACEMALLOC_FRAMES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PROFILE_SCOPE = (
+    "cProfile and loop blocking cover everything the event loop ran during "
+    "the poll, not only this integration. Allocations are limited to "
+    "tracebacks passing through this integration. snapshot_time is the time "
+    "the profiler itself spent taking tracemalloc snapshots on the loop."
+)
+
+# tracemalloc and cProfile are process and thread wide, so they are shared
+# between all profilers and polls that overlap
+_tracemalloc_users = 0
+_tracemalloc_started = False
+_active_profile: Optional[cProfile.Profile] = None
+
+def _acquire_tracemalloc() -> None:
+    """Start tracemalloc for a poll unless it is already tracing."""
+    global _tracemalloc_users, _tracemalloc_started
+    if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+        tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+        _tracemalloc_started = True
+    _tracemalloc_users += 1
+
+def _release_tracemalloc() -> None:
+    """Stop tracemalloc once the last profiled poll that started it ends."""
+    global _tracemalloc_users, _tracemalloc_started
+    _tracemalloc_users -= 1
+    if _tracemalloc_users == 0 and _tracemalloc_started:
+        tracemalloc.stop()
+        _tracemalloc_started = False
+
+def _acquire_profile() -> cProfile.Profile:
+    """Enable cProfile for a poll, raising ValueError if one is already active."""
+    global _active_profile
+    if _active_profile is not None:
+        raise ValueError("another poll is already being profiled")
+    profile = cProfile.Profile()
+    profile.enable()
+    _active_profile = profile
+    return profile
+
+def _release_profile(profile: cProfile.Profile) -> None:
+    """Disable the active cProfile."""
+    global _active_profile
+    profile.disable()
+    _active_profile = None
+
+class _LoopBlockingMonitor:
+    """Measure how long the event loop is blocked while a poll runs."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.samples: int = 0
+
+    def start(self, hass: HomeAssistant) -> None:
+        """Start sampling the event loop."""
+        self._task = hass.async_create_background_task(
+            self._run(), "alliant_energy profiler loop monitor"
+        )
+
+    async def stop(self) -> None:
+        """Stop sampling the event loop."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Record how late each sleep wakes up."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self._interval)
+            lag = loop.time() - started - self._interval
+            self.samples += 1
+            if lag > 0:
+                self.total += lag
+                self.max = max(self.max, lag)
+
+class PollProfiler:
+    """Profile the next few polls and keep summaries for diagnostics."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._remaining: int = 0
+        self.results: deque[dict[str, Any]] = deque(maxlen=PROFILE_MAX_RESULTS)
+
+    @property
+    def active(self) -> bool:
+        """Return True if upcoming polls should be profiled."""
+        return self._remaining > 0
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of polls still to be profiled."""
+        return self._remaining
+
+    def start(self, polls: int) -> None:
+        """Profile the next number of polls, or stop profiling if zero."""
+        self._remaining = polls
+        _LOGGER.debug("Profiling the next %d poll(s)", polls)
+
+    async def async_run(self, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a poll under cProfile, tracemalloc and the loop monitor.
+
+        Profiling failures are recorded in the result and never fail the poll.
+        """
+        self._remaining -= 1
+
+        result: dict[str, Any] = {"started": datetime.now().isoformat()}
+        errors: list[str] = []
+        monitor = _LoopBlockingMonitor(PROFILE_LOOP_INTERVAL)
+        monitor.start(self._hass)
+        start = time.perf_counter()
+        snapshot_time: list[float] = []
+
+        _acquire_tracemalloc()
+        before = _take_snapshot(snapshot_time, errors)
+        profile = None
+        try:
+            profile = _acquire_profile()
+        except ValueError as err:
+            errors.append(f"cProfile unavailable: {err}")
+
+        try:
+            return await func()
+        finally:
+            if profile is not None:
+                _release_profile(profile)
+            after = _take_snapshot(snapshot_time, errors)
+            _release_tracemalloc()
+            result["duration"] = time.perf_counter() - start
+            await monitor.stop()
+
+            result["loop_blocking"] = {
+                "total": monitor.total,
+                "max": monitor.max,
+                "samples": monitor.samples,
+            }
+            result["snapshot_time"] = sum(snapshot_time)
+            try:
+                if before is not None and after is not None:
+                    result["top_allocations"] = await self._hass.async_add_executor_job(
+                        _summarize_allocations, before, after
+                    )
+                if profile is not None:
+                    result["top_functions"] = await self._hass.async_add_executor_job(
+                        _summarize_profile, profile
+                    )
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(f"Failed to summarize profile: {err}")
+            if errors:
+                result["errors"] = errors
+            self.results.append(result)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profiler state for diagnostics."""
+        return {
+            "scope": PROFILE_SCOPE,
+            "remaining_polls": self._remaining,
+            "results": list(self.results),
+        }
+
+def _take_snapshot(
+    snapshot_time: list[float], errors: list[str]
+) -> Optional[tracemalloc.Snapshot]:
+    """Take a tracemalloc snapshot, recording how long it took."""
+    start = time.perf_counter()
+    try:
+        return tracemalloc.take_snapshot()
+    except RuntimeError as err:
+        errors.append(f"tracemalloc snapshot failed: {err}")
+        return None
+    finally:
+        snapshot_time.append(time.perf_counter() - start)
+
+def _summarize_profile(profile: cProfile.Profile) -> list[dict[str, Any]]:
+    """Return the functions with the highest cumulative time."""
+    stats = pstats.Stats(profile).stats
+    hot = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "total_time": total_time,
+            "cumulative_time": cumulative_time,
+        }
+        for (filename, line, name), (_, calls, total_time, cumulative_time, _) in hot[:PROFILE_TOP_N]
+    ]
+
+def _summarize_allocations(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+) -> list[dict[str, Any]]:
+    """Return the source lines that allocated the most memory during the poll.
+
+    Only allocations whose traceback passes through this integration are
+    counted, which leaves out unrelated work the event loop ran meanwhile.
+    """
+    scope = (tracemalloc.Filter(True, os.path.join(PACKAGE_DIR, "*"), all_frames=True),)
+    diff = after.filter_traces(scope).compare_to(before.filter_traces(scope), "lineno")
+    return [
+        {
+            "location": str(stat.traceback),
+            "size_diff": stat.size_diff,
+            "count_diff": stat.count_diff,
+        }
+        for stat in diff[:PROFILE_TOP_N]
+    ]
@@ -9,14 +9,12 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.dt import as_local
 
-from .const import DOMAIN, ELEC_SENSORS, UPDATE_INTERVAL
-from .client import AlliantEnergyClient, AlliantEnergyData
+from .client import AlliantEnergyData
+from .const import DOMAIN, ELEC_SENSORS, GAS_SENSORS, AlliantEntityDescription
+from .coordinator import AlliantEnergyCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,29 +24,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Alliant Energy sensors based on a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    store = data["store"]
-
-    client = AlliantEnergyClient(
-        username=entry.data["username"],
-        password=entry.data["password"],
-        store=store,
-    )
-
-    async def async_update_data() -> AlliantEnergyData:
-        """Fetch data from API endpoint."""
-        return await client.async_get_data()
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=DOMAIN,
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=UPDATE_INTERVAL),
-    )
-
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    descriptions = ELEC_SENSORS
+    if coordinator.client.has_gas:
+        descriptions += GAS_SENSORS
 
     entities = [
         AlliantEnergySensor(
@@ -56,7 +36,7 @@ async def async_setup_entry(
             entry_id=entry.entry_id,
             description=description,
         )
-        for description in ELEC_SENSORS
+        for description in descriptions
     ]
 
     async_add_entities(entities)
@@ -66,7 +46,7 @@ class AlliantEnergySensor(CoordinatorEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: AlliantEnergyCoordinator,
         entry_id: str,
         description: AlliantEntityDescription,
     ) -> None:
@@ -82,40 +62,58 @@ class AlliantEnergySensor(CoordinatorEntity, SensorEntity):
             "model": "Usage Monitor",
         }
 
+    @property
+    def _data(self) -> AlliantEnergyData | None:
+        """Return the data for this sensor's commodity."""
+        if self.entity_description.commodity == "gas":
+            return self.coordinator.data.gas
+        return self.coordinator.data
+
+    @property
+    def available(self) -> bool:
+        """Return if the sensor's commodity data is available."""
+        return super().available and self._data is not None
+
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.entity_description.value_fn(self._data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         attributes = {}
+        data = self._data
 
         # Add last update times if available
-        if self.coordinator.data.last_api_update:
-            attributes["last_api_update"] = as_local(self.coordinator.data.last_api_update).isoformat()
+        if data.last_api_update:
+            attributes["last_api_update"] = as_local(data.last_api_update).isoformat()
 
-        if self.coordinator.data.last_meter_read:
-            attributes["last_meter_read"] = as_local(self.coordinator.data.last_meter_read).isoformat()
+        if data.last_meter_read:
+            attributes["last_meter_read"] = as_local(data.last_meter_read).isoformat()
 
         # Add billing period dates if available
-        if self.coordinator.data.start_date:
-            attributes["billing_period_start"] = as_local(self.coordinator.data.start_date).isoformat()
+        if data.start_date:
+            attributes["billing_period_start"] = as_local(data.start_date).isoformat()
 
-        if self.coordinator.data.end_date:
-            attributes["billing_period_end"] = as_local(self.coordinator.data.end_date).isoformat()
+        if data.end_date:
+            attributes["billing_period_end"] = as_local(data.end_date).isoformat()
 
         # For cost sensors, add estimated flag if applicable
-        if self.entity_description.key in ["elec_cost_to_date", "elec_forecasted_cost"]:
-            attributes["is_estimated"] = self.coordinator.data.is_cost_estimated
-
-        # For cost per kWh sensor, add calculation period and customer charge
-        if self.entity_description.key == "elec_cost_per_kwh":
-            if self.coordinator.data.last_meter_read:
-                three_months_ago = self.coordinator.data.last_meter_read - timedelta(days=90)
+        if self.entity_description.key in [
+            "elec_cost_to_date",
+            "elec_forecasted_cost",
+            "gas_cost_to_date",
+            "gas_forecasted_cost",
+        ]:
+            attributes["is_estimated"] = data.is_cost_estimated
+
+        # For cost per unit sensors, add calculation period and customer charge
+        if self.entity_description.key in ["elec_cost_per_kwh", "gas_cost_per_ccf"]:
+            if data.last_meter_read:
+                three_months_ago = data.last_meter_read - timedelta(days=90)
                 attributes["calculation_period_start"] = as_local(three_months_ago).isoformat()
-                attributes["calculation_period_end"] = as_local(self.coordinator.data.last_meter_read).isoformat()
-            attributes["customer_charge_per_day"] = self.coordinator.data.customer_charge
+                attributes["calculation_period_end"] = as_local(data.last_meter_read).isoformat()
+            attributes["customer_charge_per_day"] = data.customer_charge
 
         return attributes
@@ -0,0 +1,208 @@
+"""Local tariff engine for pricing interval usage."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, time
+import logging
+from typing import Optional
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+# Length (in minutes) of the synthetic intervals used to estimate period costs
+INTERVAL_MINUTES = 15
+
+# Number of billing periods whose rate schedules are kept in memory
+PERIOD_CACHE_SIZE = 12
+
+@dataclass(frozen=True)
+class SeasonalRate:
+    """Energy rate that applies during a set of months."""
+    months: tuple[int, ...]
+    energy_rate: float
+
+@dataclass(frozen=True)
+class TimeOfUseRate:
+    """Energy rate that applies during a daily time window."""
+    start: time
+    end: time
+    energy_rate: float
+    weekdays: tuple[int, ...] = (0, 1, 2, 3, 4, 5, 6)
+    months: tuple[int, ...] = tuple(range(1, 13))
+
+@dataclass(frozen=True)
+class Tier:
+    """Per-kWh adder for consumption in the billing period up to a threshold."""
+    adder: float
+    up_to: Optional[float] = None
+
+@dataclass
+class Tariff:
+    """Rate definition used to price interval usage.
+
+    The energy rate of an interval is the base rate, overridden by a matching
+    season and then by a matching time-of-use window (later entries win).
+    Tier adders are applied on cumulative consumption within the billing
+    period, and the fixed daily charge is added per day of the period.
+    """
+    energy_rate: float
+    fixed_daily: float = 0.0
+    seasons: tuple[SeasonalRate, ...] = ()
+    time_of_use: tuple[TimeOfUseRate, ...] = ()
+    tiers: tuple[Tier, ...] = ()
+    _period_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Check that tiers ascend and only the last one is open-ended."""
+        lower = 0.0
+        for index, tier in enumerate(self.tiers):
+            if tier.up_to is None:
+                if index != len(self.tiers) - 1:
+                    raise ValueError("Only the last tier may omit up_to")
+            elif tier.up_to <= lower:
+                raise ValueError("Tier up_to values must be positive and ascending")
+            else:
+                lower = tier.up_to
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "Tariff":
+        """Create a tariff from a configuration mapping."""
+        return cls(
+            energy_rate=float(config["energy_rate"]),
+            fixed_daily=float(config.get("fixed_daily", 0.0)),
+            seasons=tuple(
+                SeasonalRate(
+                    months=tuple(season["months"]),
+                    energy_rate=float(season["energy_rate"]),
+                )
+                for season in config.get("seasons", [])
+            ),
+            time_of_use=tuple(
+                TimeOfUseRate(
+                    start=_parse_time(window["start"]),
+                    end=_parse_time(window["end"]),
+                    energy_rate=float(window["energy_rate"]),
+                    weekdays=tuple(window.get("weekdays", range(7))),
+                    months=tuple(window.get("months", range(1, 13))),
+                )
+                for window in config.get("time_of_use", [])
+            ),
+            tiers=tuple(
+                Tier(
+                    adder=float(tier["adder"]),
+                    up_to=float(tier["up_to"]) if tier.get("up_to") is not None else None,
+                )
+                for tier in config.get("tiers", [])
+            ),
+        )
+
+    def rates(self, timestamps: np.ndarray) -> np.ndarray:
+        """Return the energy rate ($/kWh) for each interval start time."""
+        timestamps = np.asarray(timestamps, dtype="datetime64[m]")
+        days = timestamps.astype("datetime64[D]")
+        minute_of_day = (timestamps - days).astype(np.int64)
+        # 1970-01-01 was a Thursday, shift so Monday is 0
+        weekday = (days.astype(np.int64) + 3) % 7
+        month = timestamps.astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+        rates = np.full(timestamps.shape, self.energy_rate, dtype=np.float64)
+
+        for season in self.seasons:
+            rates[np.isin(month, season.months)] = season.energy_rate
+
+        for window in self.time_of_use:
+            start = window.start.hour * 60 + window.start.minute
+            end = window.end.hour * 60 + window.end.minute
+            if start <= end:
+                in_window = (minute_of_day >= start) & (minute_of_day < end)
+            else:
+                # Window wraps past midnight
+                in_window = (minute_of_day >= start) | (minute_of_day < end)
+            mask = in_window & np.isin(weekday, window.weekdays) & np.isin(month, window.months)
+            rates[mask] = window.energy_rate
+
+        return rates
+
+    def tier_costs(self, kwh: np.ndarray) -> np.ndarray:
+        """Return the tier adders owed by each interval of a billing period."""
+        kwh = np.asarray(kwh, dtype=np.float64)
+        costs = np.zeros(kwh.shape, dtype=np.float64)
+        if not self.tiers:
+            return costs
+
+        cumulative = np.cumsum(kwh)
+        previous = cumulative - kwh
+        lower = 0.0
+        for tier in self.tiers:
+            upper = np.inf if tier.up_to is None else tier.up_to
+            # Share of each interval's usage that falls inside this tier
+            in_tier = np.clip(cumulative, lower, upper) - np.clip(previous, lower, upper)
+            costs += in_tier * tier.adder
+            lower = upper
+        return costs
+
+    def price_intervals(self, timestamps: np.ndarray, kwh: np.ndarray) -> np.ndarray:
+        """Return the energy cost of each interval, excluding fixed charges."""
+        kwh = np.asarray(kwh, dtype=np.float64)
+        return kwh * self.rates(timestamps) + self.tier_costs(kwh)
+
+    def period_cost(self, timestamps: np.ndarray, kwh: np.ndarray, days: float) -> float:
+        """Return the total cost of a billing period's interval usage."""
+        return float(self.price_intervals(timestamps, kwh).sum()) + days * self.fixed_daily
+
+    def estimate_cost(
+        self, start: datetime, end: datetime, kwh: float, until: Optional[datetime] = None
+    ) -> Optional[float]:
+        """Estimate the cost of usage spread evenly over a billing period.
+
+        Used when only a usage total is known. With until, the usage is spread
+        from the period start up to that time only, for cost-to-date figures.
+        Interval rates are cached per billing period, so repeated estimates
+        only redo the multiply and tier passes. Returns None if the period or
+        the time elapsed in it is empty.
+        """
+        if start is None or end is None or kwh is None:
+            return None
+
+        start = _naive_local(start)
+        end = _naive_local(end)
+        until = min(_naive_local(until) if until else end, end)
+        if end <= start or until <= start:
+            return None
+
+        rates = self._period_rates(start, end)
+        elapsed = int((until - start).total_seconds() // (INTERVAL_MINUTES * 60))
+        rates = rates[:max(elapsed, 1)]
+
+        usage = np.full(rates.shape, kwh / len(rates), dtype=np.float64)
+        days = (until - start).total_seconds() / 86400
+        return float((usage * rates + self.tier_costs(usage)).sum()) + days * self.fixed_daily
+
+    def _period_rates(self, start: datetime, end: datetime) -> np.ndarray:
+        """Return the cached interval rates for a billing period."""
+        key = (start, end)
+        rates = self._period_cache.get(key)
+        if rates is None:
+            if len(self._period_cache) >= PERIOD_CACHE_SIZE:
+                self._period_cache.pop(next(iter(self._period_cache)))
+            timestamps = np.arange(
+                np.datetime64(start, "m"),
+                np.datetime64(end, "m"),
+                np.timedelta64(INTERVAL_MINUTES, "m"),
+            )
+            rates = self._period_cache[key] = self.rates(timestamps)
+            _LOGGER.debug("Cached %d interval rates for %s - %s", len(rates), start, end)
+        return rates
+
+def _naive_local(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive local time."""
+    if value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+def _parse_time(value) -> time:
+    """Parse a time of day given as a time or an HH:MM string."""
+    if isinstance(value, time):
+        return value
+    return time.fromisoformat(str(value))
@@ -0,0 +1,67 @@
+"""Benchmark the tariff engine on a year of 15-minute interval data."""
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+
+# Load the tariff module directly so Home Assistant isn't needed
+TARIFF_PATH = Path(__file__).parent.parent / "custom_components" / "alliant_energy" / "tariff.py"
+spec = importlib.util.spec_from_file_location("tariff", TARIFF_PATH)
+tariff_module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = tariff_module
+spec.loader.exec_module(tariff_module)
+
+TARIFF = tariff_module.Tariff.from_dict({
+    "energy_rate": 0.11,
+    "fixed_daily": 0.4932,
+    "seasons": [{"months": [6, 7, 8, 9], "energy_rate": 0.13}],
+    "time_of_use": [
+        {"start": "14:00", "end": "20:00", "weekdays": [0, 1, 2, 3, 4], "energy_rate": 0.24},
+        {"start": "22:00", "end": "06:00", "energy_rate": 0.07},
+    ],
+    "tiers": [{"up_to": 500, "adder": 0.0}, {"up_to": 1000, "adder": 0.01}, {"adder": 0.02}],
+})
+
+RUNS = 20
+
+def main():
+    """Run the benchmark."""
+    timestamps = np.arange(
+        np.datetime64("2024-01-01T00:00"),
+        np.datetime64("2025-01-01T00:00"),
+        np.timedelta64(15, "m"),
+    )
+    rng = np.random.default_rng(0)
+    kwh = rng.gamma(2.0, 0.15, size=len(timestamps))
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        total = TARIFF.period_cost(timestamps, kwh, days=366)
+    elapsed = (time.perf_counter() - start) / RUNS
+
+    print(f"Intervals:          {len(timestamps):,}")
+    print(f"Total cost:         ${total:,.2f} for {kwh.sum():,.1f} kWh")
+    print(f"Time per year:      {elapsed * 1000:.2f} ms")
+    print(f"Throughput:         {len(timestamps) / elapsed:,.0f} intervals/s")
+
+    period_start = datetime(2024, 7, 3)
+    period_end = datetime(2024, 8, 2)
+    now = datetime(2024, 7, 20, 12, 0)
+
+    start = time.perf_counter()
+    TARIFF.estimate_cost(period_start, period_end, 900.0, until=now)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        TARIFF.estimate_cost(period_start, period_end, 900.0, until=now)
+    warm = (time.perf_counter() - start) / RUNS
+
+    print(f"Cost to date, cold: {cold * 1e6:.0f} µs")
+    print(f"Cost to date, warm: {warm * 1e6:.0f} µs")
+
+if __name__ == "__main__":
+    main()
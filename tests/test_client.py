@@ -0,0 +1,219 @@
+"""Tests for the Alliant Energy API client."""
+import asyncio
+import importlib.util
+from pathlib import Path
+import sys
+import time
+
+import aiohttp
+import pytest
+
+# Load the client module directly so Home Assistant isn't needed
+CLIENT_PATH = Path(__file__).parent.parent / "custom_components" / "alliant_energy" / "client.py"
+spec = importlib.util.spec_from_file_location("client", CLIENT_PATH)
+client_module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = client_module
+spec.loader.exec_module(client_module)
+
+AlliantEnergyAuthError = client_module.AlliantEnergyAuthError
+AlliantEnergyClient = client_module.AlliantEnergyClient
+
+HISTORICAL = {
+    "readingFrom": "2026-08-01T00:00:00Z",
+    "readingTo": "2026-09-01T00:00:00Z",
+    "amount": "100",
+    "consumption": "700",
+}
+
+PROJECTED = {
+    "soFarThisMonthProjectedConsumption": "300",
+    "projectedConsumption": "700",
+    "averageThisYearConsumption": "650",
+    "soFarThisMonthProjectedAmount": "40",
+    "projectedAmount": "95",
+    "averageThisYearAmount": "90",
+}
+
+RESPONSES = {
+    "Electric": (200, {"Result": {"electricUsages": [HISTORICAL]}}),
+    "ProjectedElectric": (200, {"Result": {"projectedElectric": PROJECTED}}),
+    "Gas": (200, {"Result": {"gasUsages": [HISTORICAL]}}),
+    "ProjectedGas": (200, {"Result": {"projectedGas": PROJECTED}}),
+}
+
+class FakeStore:
+    """Store returning fixed authentication data."""
+
+    def __init__(self, data):
+        self.data = data
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+
+class FakeResponse:
+    """Minimal aiohttp response."""
+
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    async def json(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class FakeSession:
+    """Session answering usage requests by endpoint name."""
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def get(self, url, params=None, headers=None):
+        response = self.responses[url.rsplit("/", 1)[-1]]
+        if isinstance(response, Exception):
+            raise response
+        return FakeResponse(*response)
+
+    def post(self, url, json=None, headers=None):
+        return FakeResponse(*self.responses[url.rsplit("/", 1)[-1]])
+
+def make_client(responses, gas=True):
+    """Return a client that is already logged in."""
+    client = AlliantEnergyClient("user", "pass")
+    client._session = FakeSession({**RESPONSES, **responses})
+    client._token = "token"
+    client._token_expires_at = time.time() + 3600
+    client._meter_number = "E1"
+    client._gas_meter_number = "G1" if gas else None
+    client.logins = 0
+
+    async def fake_get_token(use_refresh_token=False):
+        client.logins += 1
+
+    client._get_token = fake_get_token
+    return client
+
+def test_electric_and_gas_data():
+    """Test that gas data is attached to the electric data."""
+    client = make_client({})
+
+    data = asyncio.run(client.async_get_data())
+
+    assert data.usage_to_date == 300
+    assert data.gas is not None
+    assert data.gas.usage_to_date == 300
+    assert data.gas.customer_charge == 0
+
+@pytest.mark.parametrize(
+    "gas_response",
+    [
+        (401, None),
+        aiohttp.ClientError("boom"),
+        (200, {"Result": {}}),
+    ],
+)
+def test_gas_failure_only_drops_gas(gas_response):
+    """Test that gas errors leave the electric data intact."""
+    client = make_client({"Gas": gas_response})
+
+    data = asyncio.run(client.async_get_data())
+
+    assert data.usage_to_date == 300
+    assert data.cost_to_date == 40
+    assert data.gas is None
+    assert client.logins == 0
+
+def test_electric_error_fails_poll():
+    """Test that electric errors still fail the poll."""
+    client = make_client({"Electric": aiohttp.ClientError("boom")})
+
+    with pytest.raises(aiohttp.ClientError):
+        asyncio.run(client.async_get_data())
+
+def test_electric_401_reauthenticates_once():
+    """Test that an electric 401 logs in again once, then raises."""
+    client = make_client({"Electric": (401, None)})
+
+    with pytest.raises(AlliantEnergyAuthError):
+        asyncio.run(client.async_get_data())
+
+    assert client.logins == 1
+
+def test_cached_auth_without_gas_meter_is_stale():
+    """Test that auth cached before gas support forces meter rediscovery."""
+    cached = {
+        "token": "token",
+        "expires_at": time.time() + 3600,
+        "meter_number": "E1",
+    }
+    client = AlliantEnergyClient("user", "pass", store=FakeStore(cached))
+
+    assert asyncio.run(client._load_cached_auth()) is False
+
+    cached["gas_meter_number"] = None
+    assert asyncio.run(client._load_cached_auth()) is True
+    assert client.has_gas is False
+
+@pytest.mark.parametrize(
+    ("meters", "electric", "gas"),
+    [
+        ([{"meterNumber": "E1", "meterType": "Electric"}, {"meterNumber": "G1", "meterType": "Gas"}], "E1", "G1"),
+        ([{"meterNumber": "G1", "serviceType": "G"}, {"meterNumber": "E1", "serviceType": "E"}], "E1", "G1"),
+        ([{"meterNumber": "E1", "meterType": "Generation"}], "E1", None),
+        ([{"meterNumber": "E1"}], "E1", None),
+    ],
+)
+def test_meter_discovery(meters, electric, gas):
+    """Test that only explicit gas meter types are treated as gas."""
+    client = make_client({"GetMeterAndPremise": (200, {"data": meters})})
+
+    asyncio.run(client._get_meter_details())
+
+    assert client._meter_number == electric
+    assert client._gas_meter_number == gas
+    assert client.has_gas is (gas is not None)
+
+def test_meter_discovery_never_uses_gas_meter_for_electric():
+    """Test that a premise with only a gas meter is rejected."""
+    client = make_client({"GetMeterAndPremise": (200, {"data": [{"meterNumber": "G1", "meterType": "Gas"}]})})
+
+    with pytest.raises(AlliantEnergyAuthError):
+        asyncio.run(client._get_meter_details())
+
+def load_tariff():
+    """Load the tariff module directly."""
+    tariff_spec = importlib.util.spec_from_file_location("tariff", CLIENT_PATH.parent / "tariff.py")
+    tariff = importlib.util.module_from_spec(tariff_spec)
+    sys.modules[tariff_spec.name] = tariff
+    tariff_spec.loader.exec_module(tariff)
+    return tariff.Tariff.from_dict({"energy_rate": 1.0})
+
+def test_tariff_does_not_replace_api_costs():
+    """Test that API cost figures are kept when a tariff is configured."""
+    client = make_client({}, gas=False)
+    client._tariff = load_tariff()
+
+    data = asyncio.run(client.async_get_data())
+
+    assert data.cost_to_date == 40
+    assert data.forecasted_cost == 95
+    assert data.is_cost_estimated is False
+
+def test_tariff_prices_missing_api_costs():
+    """Test that the tariff prices electric costs the API reports as zero."""
+    projected = {**PROJECTED, "soFarThisMonthProjectedAmount": "0", "projectedAmount": "0"}
+    client = make_client({"ProjectedElectric": (200, {"Result": {"projectedElectric": projected}})}, gas=False)
+    client._tariff = load_tariff()
+
+    data = asyncio.run(client.async_get_data())
+
+    # 700 kWh at $1/kWh with no fixed charge
+    assert data.forecasted_cost == pytest.approx(700)
+    assert data.is_cost_estimated is True
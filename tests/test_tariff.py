@@ -0,0 +1,159 @@
+"""Tests for the Alliant Energy tariff engine."""
+from datetime import datetime, timedelta, timezone
+import importlib.util
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+# Load the tariff module directly so Home Assistant isn't needed
+TARIFF_PATH = Path(__file__).parent.parent / "custom_components" / "alliant_energy" / "tariff.py"
+spec = importlib.util.spec_from_file_location("tariff", TARIFF_PATH)
+tariff = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = tariff
+spec.loader.exec_module(tariff)
+
+Tariff = tariff.Tariff
+
+START = datetime(2024, 1, 1)
+
+def test_flat_rate_with_fixed_charge_and_tier():
+    """Test the hand-checked flat rate, fixed charge and tier adder case."""
+    rates = Tariff.from_dict({
+        "energy_rate": 0.1,
+        "fixed_daily": 1.0,
+        "tiers": [{"up_to": 500, "adder": 0.0}, {"adder": 0.01}],
+    })
+
+    cost = rates.estimate_cost(START, START + timedelta(days=30), 1000)
+
+    assert cost == pytest.approx(135)
+
+def test_tier_costs_split_intervals_across_boundaries():
+    """Test that an interval crossing tier thresholds is split between tiers."""
+    rates = Tariff.from_dict({
+        "energy_rate": 0.1,
+        "tiers": [
+            {"up_to": 500, "adder": 0.0},
+            {"up_to": 1000, "adder": 0.01},
+            {"adder": 0.02},
+        ],
+    })
+
+    costs = rates.tier_costs([300, 300, 500])
+
+    # 100 kWh in the second tier, then 400 in the second and 100 in the third
+    np.testing.assert_allclose(costs, [0.0, 1.0, 6.0])
+
+def test_seasons_and_time_of_use_by_weekday_and_month():
+    """Test seasonal rates and weekday time-of-use overrides."""
+    rates = Tariff.from_dict({
+        "energy_rate": 0.1,
+        "seasons": [{"months": [7], "energy_rate": 0.2}],
+        "time_of_use": [
+            {"start": "14:00", "end": "20:00", "weekdays": [0, 1, 2, 3, 4], "energy_rate": 0.3},
+        ],
+    })
+    timestamps = np.array(
+        [
+            "2024-01-01T15:00",  # Monday, on peak
+            "2024-01-06T15:00",  # Saturday, off peak
+            "2024-01-01T20:00",  # Monday, window end is exclusive
+            "2024-07-06T10:00",  # Saturday in July, seasonal rate
+            "2024-07-08T14:00",  # Monday in July, on peak beats season
+        ],
+        dtype="datetime64[m]",
+    )
+
+    np.testing.assert_allclose(rates.rates(timestamps), [0.3, 0.1, 0.1, 0.2, 0.3])
+
+def test_time_of_use_window_wrapping_past_midnight():
+    """Test a time-of-use window that wraps past midnight."""
+    rates = Tariff.from_dict({
+        "energy_rate": 0.1,
+        "time_of_use": [{"start": "22:00", "end": "06:00", "energy_rate": 0.05}],
+    })
+    timestamps = np.array(
+        ["2024-01-01T21:45", "2024-01-01T22:00", "2024-01-02T03:00", "2024-01-02T06:00"],
+        dtype="datetime64[m]",
+    )
+
+    np.testing.assert_allclose(rates.rates(timestamps), [0.1, 0.05, 0.05, 0.1])
+
+def test_price_intervals_and_period_cost():
+    """Test pricing interval usage against per-interval rates and tiers."""
+    rates = Tariff.from_dict({
+        "energy_rate": 0.1,
+        "fixed_daily": 0.5,
+        "time_of_use": [{"start": "00:00", "end": "12:00", "energy_rate": 0.2}],
+        "tiers": [{"up_to": 1, "adder": 0.0}, {"adder": 1.0}],
+    })
+    timestamps = np.array(["2024-01-01T06:00", "2024-01-01T18:00"], dtype="datetime64[m]")
+
+    np.testing.assert_allclose(rates.price_intervals(timestamps, [1, 2]), [0.2, 2.2])
+    assert rates.period_cost(timestamps, [1, 2], days=1) == pytest.approx(2.9)
+
+def test_estimate_cost_until_prices_elapsed_part_of_period():
+    """Test that until spreads usage only over the elapsed part of the period."""
+    rates = Tariff.from_dict({
+        "energy_rate": 0.1,
+        "fixed_daily": 1.0,
+        "seasons": [{"months": [2], "energy_rate": 1.0}],
+    })
+    end = datetime(2024, 3, 1)
+
+    # Only January has elapsed, so the February rate is never used
+    cost = rates.estimate_cost(START, end, 310, until=datetime(2024, 2, 1))
+
+    assert cost == pytest.approx(31 + 31)
+
+def test_estimate_cost_until_past_end_is_clamped():
+    """Test that until after the period end prices the whole period."""
+    rates = Tariff.from_dict({"energy_rate": 0.1, "fixed_daily": 1.0})
+    end = START + timedelta(days=10)
+
+    assert rates.estimate_cost(START, end, 100, until=end + timedelta(days=5)) == pytest.approx(20)
+
+def test_estimate_cost_returns_none_for_empty_periods():
+    """Test that empty periods and elapsed times can't be priced."""
+    rates = Tariff.from_dict({"energy_rate": 0.1})
+    end = START + timedelta(days=30)
+
+    assert rates.estimate_cost(START, START, 100) is None
+    assert rates.estimate_cost(START, end, 100, until=START) is None
+    assert rates.estimate_cost(START, end, 100, until=START - timedelta(days=1)) is None
+    assert rates.estimate_cost(None, end, 100) is None
+    assert rates.estimate_cost(START, end, None) is None
+
+def test_estimate_cost_accepts_mixed_timezone_awareness():
+    """Test that aware and naive datetimes can be mixed."""
+    rates = Tariff.from_dict({"energy_rate": 0.1})
+    start = START.replace(tzinfo=timezone.utc)
+    end = start + timedelta(days=30)
+    until = (start + timedelta(days=15)).astimezone().replace(tzinfo=None)
+
+    assert rates.estimate_cost(start, end, 100, until=until) == pytest.approx(10)
+
+def test_estimate_cost_reuses_cached_period_rates():
+    """Test that rates are cached per billing period."""
+    rates = Tariff.from_dict({"energy_rate": 0.1})
+    end = START + timedelta(days=30)
+
+    rates.estimate_cost(START, end, 100, until=START + timedelta(days=1))
+    rates.estimate_cost(START, end, 100, until=START + timedelta(days=2))
+
+    assert len(rates._period_cache) == 1
+
+@pytest.mark.parametrize(
+    "tiers",
+    [
+        [{"up_to": 1000, "adder": 0.0}, {"up_to": 500, "adder": 0.01}],
+        [{"adder": 0.0}, {"up_to": 500, "adder": 0.01}],
+        [{"up_to": 0, "adder": 0.0}],
+    ],
+)
+def test_invalid_tiers_are_rejected(tiers):
+    """Test that tiers must ascend with only the last one open-ended."""
+    with pytest.raises(ValueError):
+        Tariff.from_dict({"energy_rate": 0.1, "tiers": tiers})